@@ -0,0 +1,31 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from toolbox.dedupcsv import _amount_units
+
+
+def _units(values):
+    return _amount_units(pa.chunked_array([pa.array(values, pa.string())]))
+
+
+def test_scale_follows_the_data():
+    units = _units(["0.125", "-0.125", "1.5", " 7 "])
+    assert units.dtype == np.int64
+    assert units.tolist() == [125, -125, 1500, 7000]
+
+
+def test_falls_back_to_float_when_no_scale_fits():
+    units = _units(["1e-30", "-1e-30"])
+    assert units.dtype == np.float64
+    assert units[0] == -units[1]
+
+
+def test_non_numeric_text_raises():
+    with pytest.raises(pa.ArrowInvalid):
+        _units(["5", "abc"])
+
+
+def test_nan_text_raises():
+    with pytest.raises(pa.ArrowInvalid):
+        _units(["5", "NaN"])
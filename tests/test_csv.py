@@ -0,0 +1,25 @@
+import datetime as dt
+import io
+
+import pyarrow as pa
+
+from toolbox._csv import write_csv
+
+
+def _csv(table):
+    sink = io.BytesIO()
+    assert write_csv(sink, table.schema, table.to_batches()) == table.num_rows
+    return sink.getvalue().decode().splitlines()
+
+
+def test_timestamps_are_written_as_iso_text():
+    ts = pa.array([dt.datetime(2024, 1, 5), dt.datetime(2024, 1, 5, 3),
+                   dt.datetime(2024, 1, 5, 3, 0, 0, 250000), None], pa.timestamp("ns"))
+    assert _csv(pa.table({"ts": ts})) == [
+        '"ts"', '"2024-01-05"', '"2024-01-05 03:00:00"', '"2024-01-05 03:00:00.250000000"', "",
+    ]
+
+
+def test_other_columns_are_unchanged():
+    table = pa.table({"d": [dt.date(2024, 1, 5)], "n": [7]})
+    assert _csv(table) == ['"d","n"', "2024-01-05,7"]
@@ -0,0 +1,41 @@
+from collections import Counter
+
+import numpy as np
+
+from toolbox.dedupcsv import _find_pairs
+
+
+def _pairs(amounts):
+    pos_idx, neg_idx = _find_pairs(np.asarray(amounts))
+    return sorted(zip(pos_idx.tolist(), neg_idx.tolist()))
+
+
+def test_every_offsetting_row_is_paired():
+    # Each positive pairs with one negative of equal magnitude, so all four go.
+    assert _pairs([5.0, 5.0, -5.0, -5.0]) == [(0, 2), (1, 3)]
+
+
+def test_pairs_follow_file_order_within_a_magnitude():
+    assert _pairs([5.0, -5.0, 5.0, 3.0, -5.0]) == [(0, 1), (2, 4)]
+
+
+def test_unmatched_and_zero_rows_are_kept():
+    assert _pairs([5.0, 5.0, -5.0, 0.0, -0.0, 7.0, -8.0]) == [(0, 2)]
+
+
+def test_integer_cents_match_like_floats():
+    amounts = np.array([12.5, -12.5, 3.0, -3.0, 3.0])
+    assert _pairs(amounts) == _pairs((amounts * 100).astype(np.int64))
+
+
+def test_pair_count_matches_reference():
+    rng = np.random.default_rng(0)
+    for n in (0, 1, 2, 50, 1000):
+        amounts = rng.integers(-5, 6, n).astype(np.float64)
+        pairs = _pairs(amounts)
+        pos = [p for p, _ in pairs]
+        neg = [q for _, q in pairs]
+        assert all(amounts[p] > 0 and amounts[p] == -amounts[q] for p, q in pairs)
+        assert len(set(pos) | set(neg)) == 2 * len(pairs)
+        counts = Counter(amounts.tolist())
+        assert len(pairs) == sum(min(c, counts[-k]) for k, c in counts.items() if k > 0)
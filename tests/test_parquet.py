@@ -0,0 +1,73 @@
+import datetime as dt
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from toolbox._parquet import iter_relevant
+
+
+def _write(tmp_path, name, table, **kwargs):
+    path = tmp_path / name
+    pq.write_table(table, path, **kwargs)
+    return path
+
+
+def _kept(files, bounds):
+    return [f.name for f, _ in iter_relevant(files, bounds)]
+
+
+def test_int_stats_prune(tmp_path):
+    inside = _write(tmp_path, "in.parquet", pa.table({"Acct": [1, 5]}))
+    outside = _write(tmp_path, "out.parquet", pa.table({"Acct": [7, 9]}))
+    assert _kept([inside, outside], {"Acct": (3, 3)}) == ["in.parquet"]
+
+
+def test_string_stats_prune(tmp_path):
+    inside = _write(tmp_path, "in.parquet", pa.table({"Acct": ["100", "300"]}))
+    outside = _write(tmp_path, "out.parquet", pa.table({"Acct": ["400", "500"]}))
+    assert _kept([inside, outside], {"Acct": ("200", "200")}) == ["in.parquet"]
+
+
+def test_date32_stats_prune(tmp_path):
+    dates = lambda *d: pa.array([dt.date(2024, m, 1) for m in d], pa.date32())
+    inside = _write(tmp_path, "in.parquet", pa.table({"PostDate": dates(1, 3)}))
+    outside = _write(tmp_path, "out.parquet", pa.table({"PostDate": dates(6, 7)}))
+    bounds = {"PostDate": (dt.datetime(2024, 2, 1), dt.datetime(2024, 2, 29))}
+    assert _kept([inside, outside], bounds) == ["in.parquet"]
+
+
+def test_string_bound_on_int_column(tmp_path):
+    path = _write(tmp_path, "gl.parquet", pa.table({"Acct": [7, 9]}))
+    assert _kept([path], {"Acct": ("3", "3")}) == []
+    # A bound that is not a number can never be compared, so nothing is pruned.
+    assert _kept([path], {"Acct": ("abc", "abc")}) == ["gl.parquet"]
+
+
+def test_date_bound_on_text_date_column_keeps_file(tmp_path):
+    # "12/31/2023" sorts after "2024-..." as text; comparing would wrongly prune.
+    path = _write(tmp_path, "gl.parquet", pa.table({"PostDate": ["12/31/2023", "01/15/2024"]}))
+    bounds = {"PostDate": (dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 31))}
+    assert _kept([path], bounds) == ["gl.parquet"]
+
+
+def test_missing_stats_keep_file(tmp_path):
+    path = _write(tmp_path, "gl.parquet", pa.table({"Acct": [7, 9]}), write_statistics=False)
+    assert _kept([path], {"Acct": (3, 3)}) == ["gl.parquet"]
+
+
+def test_zero_row_groups_skip_file(tmp_path):
+    path = tmp_path / "gl.parquet"
+    pq.ParquetWriter(path, pa.schema([("Acct", pa.int64())])).close()
+    assert pq.read_metadata(path).num_row_groups == 0
+    assert _kept([path], {"Acct": (3, 3)}) == []
+
+
+def test_empty_row_group_skips_file(tmp_path):
+    path = _write(tmp_path, "gl.parquet", pa.table({"Acct": pa.array([], pa.int64())}))
+    assert _kept([path], {"Acct": (3, 3)}) == []
+
+
+def test_schema_is_yielded(tmp_path):
+    path = _write(tmp_path, "gl.parquet", pa.table({"Acct": [3]}))
+    [(f, schema)] = iter_relevant([path], {"Acct": (3, 3)})
+    assert f == path and schema.field("Acct").type == pa.int64()
@@ -0,0 +1,61 @@
+"""
+CSV output shared by the commands.
+
+`write_csv` streams record batches through Arrow's CSV writer.  Arrow prints
+timestamps at their full stored precision (``2024-01-05 00:00:00.000000000``),
+so timestamp columns are first rendered as ISO text the way pandas wrote them:
+a bare date at midnight, whole seconds without a fraction.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import BinaryIO, Iterable, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+
+def _iso_timestamps(col: pa.Array) -> pa.Array:
+    """Return timestamp *col* as ISO text; other columns are returned as is."""
+    typ = col.type
+    if not pa.types.is_timestamp(typ):
+        return col
+    tz = "%z" if typ.tz else ""
+    secs = pc.cast(col, pa.timestamp("s", typ.tz), safe=False)
+    text = pc.if_else(
+        pc.equal(pc.cast(secs, typ), col),
+        pc.strftime(secs, format=f"%Y-%m-%d %H:%M:%S{tz}"),
+        pc.strftime(col, format=f"%Y-%m-%d %H:%M:%S{tz}"),
+    )
+    if typ.tz is None:                     # an aware midnight keeps its offset
+        text = pc.if_else(
+            pc.equal(pc.floor_temporal(col, unit="day"), col),
+            pc.strftime(secs, format="%Y-%m-%d"),
+            text,
+        )
+    return text
+
+
+def _csv_schema(schema: pa.Schema) -> pa.Schema:
+    """Return *schema* with timestamp fields retyped as the text they are written as."""
+    for i, field in enumerate(schema):
+        if pa.types.is_timestamp(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+
+def write_csv(sink: Union[Path, BinaryIO], schema: pa.Schema,
+              batches: Iterable[pa.RecordBatch]) -> int:
+    """Write *batches* of *schema* as CSV to *sink*; return the row count."""
+    out_schema = _csv_schema(schema)
+    n_rows = 0
+    with pacsv.CSVWriter(sink, out_schema) as writer:
+        for batch in batches:
+            if out_schema is not schema:
+                batch = pa.record_batch([_iso_timestamps(c) for c in batch.columns],
+                                        schema=out_schema)
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+    return n_rows
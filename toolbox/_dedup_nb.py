@@ -0,0 +1,73 @@
+"""
+Pair matching shared by the dedup commands.
+
+`find_pairs` is the entry point.  Its kernel `match_pairs` walks amounts that are already sorted by (abs, sign) and emits
+the positions of cancelling pairs.  Magnitudes are passed as the int64 bit
+pattern of abs(amount): for non-negative floats that pattern sorts like the
+value and is equal exactly when the values are, so no float compares (or
+hashing) are needed anywhere.  Inputs must be C-contiguous (fancy-indexing
+with the sort order always produces fresh contiguous arrays), which lets the
+loop compile without stride arithmetic.  The signature is given explicitly
+so the kernel is compiled eagerly (and cached on disk) instead of on first
+call; the commands therefore import this module lazily, only on the code
+path that matches pairs.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit("UniTuple(int64[::1], 2)(int64[::1], boolean[::1])", cache=True)
+def match_pairs(key, neg):
+    """
+    Return (pos, neg) positions into the sorted arrays that cancel each other.
+
+    *key* is abs(amount) as produced by `amount_keys`, sorted ascending; *neg*
+    flags negative amounts and is False-first inside each run of equal *key*.
+    The n-th positive of a run pairs with the n-th negative.
+    """
+    n = key.shape[0]
+    pos_out = np.empty(n // 2, dtype=np.int64)
+    neg_out = np.empty(n // 2, dtype=np.int64)
+    k = 0
+    i = 0
+    while i < n:
+        # Run of equal key: positives in [i, m), negatives in [m, j)
+        m = i
+        while m < n and key[m] == key[i] and not neg[m]:
+            m += 1
+        j = m
+        while j < n and key[j] == key[i]:
+            j += 1
+        for p in range(min(m - i, j - m)):
+            pos_out[k] = i + p
+            neg_out[k] = m + p
+            k += 1
+        i = j
+    return pos_out[:k], neg_out[:k]
+
+
+def amount_keys(amt: np.ndarray) -> np.ndarray:
+    """Return abs(*amt*) as int64 matching keys (integer units used as-is)."""
+    if amt.dtype.kind in "iu":
+        return np.abs(amt).astype(np.int64, copy=False)
+    return np.abs(amt.astype(np.float64, copy=False)).view(np.int64)
+
+
+def find_pairs(amt: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (pos_idx, neg_idx): int64 positions into *amt* that cancel each
+    other.  Matching key is just abs(amount); within one magnitude the n-th
+    positive (in input order) pairs with the n-th negative.
+    """
+    # Sort by (abs, sign) – positives precede negatives of equal magnitude,
+    # and lexsort is stable so input order is kept inside each run.
+    key = amount_keys(amt)
+    neg = amt < 0
+    order = np.lexsort((neg, key))
+    pos_idx, neg_idx = match_pairs(key[order], neg[order])
+    return order[pos_idx], order[neg_idx]
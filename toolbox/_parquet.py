@@ -0,0 +1,88 @@
+"""
+Parquet helpers shared by the GL commands.
+
+`parquet_files` resolves the GL_PATH argument; `iter_relevant` reads only the
+parquet footers and drops files whose row-group statistics prove they cannot
+hold a row inside the requested bounds.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, Tuple
+
+import click
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+Bounds = Mapping[str, Tuple[Any, Any]]
+
+
+def parquet_files(path: Path) -> Iterable[Path]:
+    """Yield each *.parquet file (non-recursive)."""
+    if path.is_file() and path.suffix == ".parquet":
+        yield path
+    elif path.is_dir():
+        yield from sorted(path.glob("*.parquet"))
+    else:
+        raise click.BadParameter(f"{path} is neither a directory nor a parquet file.")
+
+
+def _as_column_type(value: Any, typ: pa.DataType) -> Optional[Any]:
+    """
+    Convert a bound to the column's own type, or None if that is not exact.
+
+    Non-string bounds are never compared against string columns: a date bound
+    on a text date column would otherwise be compared lexicographically.
+    """
+    if (pa.types.is_string(typ) or pa.types.is_large_string(typ)) and not isinstance(value, str):
+        return None
+    try:
+        return pa.scalar(value).cast(typ).as_py()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return None
+
+
+def iter_relevant(files: Iterable[Path], bounds: Bounds) -> Iterator[Tuple[Path, pa.Schema]]:
+    """
+    Yield (file, arrow schema) for the files that may contain a row with every
+    column in *bounds* inside its inclusive (lo, hi) range.
+
+    Only footers are read, and the schema is handed on so callers need not
+    parse the footer again.  A file is skipped when each of its row groups has
+    min/max statistics excluding at least one bound; missing statistics or
+    bounds that do not convert to the column type never skip anything.
+    """
+    for f in files:
+        meta = pq.read_metadata(f)
+        schema = meta.schema.to_arrow_schema()
+        columns = {
+            meta.row_group(0).column(i).path_in_schema: i
+            for i in range(meta.num_columns)
+        } if meta.num_row_groups else {}
+
+        checks = []
+        for name, (lo, hi) in bounds.items():
+            if name not in columns:
+                continue
+            typ = schema.field(name).type
+            lo, hi = _as_column_type(lo, typ), _as_column_type(hi, typ)
+            if lo is not None and hi is not None:
+                checks.append((columns[name], lo, hi))
+
+        for r in range(meta.num_row_groups):
+            rg = meta.row_group(r)
+            if rg.num_rows and all(_may_overlap(rg.column(i).statistics, lo, hi)
+                                   for i, lo, hi in checks):
+                yield f, schema
+                break
+
+
+def _may_overlap(stats: Optional[pq.Statistics], lo: Any, hi: Any) -> bool:
+    """False only when *stats* prove the column lies entirely outside [lo, hi]."""
+    if stats is None or not stats.has_min_max:
+        return True
+    try:
+        return not (stats.max < lo or stats.min > hi)
+    except TypeError:
+        return True
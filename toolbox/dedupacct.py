@@ -20,45 +20,74 @@ toolbox dedupacct ./gl_parquet                    ^
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Iterable, List, Tuple, Set
+from typing import Tuple
 
 import click
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ._csv import write_csv
+from ._parquet import iter_relevant, parquet_files
 
 
 # ───────────────────────── helper functions ──────────────────────────
-def _parquet_files(path: Path) -> Iterable[Path]:
-    """Yield each *.parquet file (non-recursive)."""
-    if path.is_file() and path.suffix == ".parquet":
-        yield path
-    elif path.is_dir():
-        yield from sorted(path.glob("*.parquet"))
+def _date_filter(date_col: str, date_type: pa.DataType,
+                 start: pd.Timestamp, end: pd.Timestamp) -> pc.Expression:
+    """
+    Return the inclusive [start, end] test for *date_col*.
+
+    Date and naive timestamp columns are compared as stored, against bounds
+    cast to the same type, so the reader can prune on their statistics.  Any
+    other column is cast to timestamp[ns] in Arrow, which only parses ISO
+    text (YYYY-MM-DD); anything else raises ArrowInvalid.
+    """
+    if pa.types.is_date(date_type) or (pa.types.is_timestamp(date_type) and date_type.tz is None):
+        posted = pc.field(date_col)
+        lo = pa.scalar(start).cast(date_type, safe=False)
+        hi = pa.scalar(end).cast(date_type, safe=False)
     else:
-        raise click.BadParameter(f"{path} is neither a directory nor a parquet file.")
-
-
-def _find_pairs(df: pd.DataFrame, amt_col: str) -> List[Tuple[int, int]]:
-    """Return list of (row_idx_pos, row_idx_neg) that cancel each other."""
-    positives: dict[float, int] = {}
-    negatives: dict[float, int] = {}
-    pairs: list[Tuple[int, int]] = []
-
-    for idx, amount in df[amt_col].items():
-        key = abs(amount)
-        if amount >= 0:
-            neg_idx = negatives.pop(key, None)
-            if neg_idx is not None:
-                pairs.append((idx, neg_idx))
-            else:
-                positives[key] = idx
-        else:
-            pos_idx = positives.pop(key, None)
-            if pos_idx is not None:
-                pairs.append((pos_idx, idx))
-            else:
-                negatives[key] = idx
-    return pairs
+        posted = pc.field(date_col).cast(pa.timestamp("ns"))
+        lo = pa.scalar(start, type=pa.timestamp("ns"))
+        hi = pa.scalar(end, type=pa.timestamp("ns"))
+    return (posted >= lo) & (posted <= hi)
+
+
+def _read_account(relevant: Tuple[Path, pa.Schema], acct_col: str, acct_num: str,
+                  date_col: str, start: pd.Timestamp, end: pd.Timestamp) -> pa.Table:
+    """
+    Read the rows of one (path, schema) pair from `iter_relevant` for
+    *acct_num* posted in [start, end].  The date test is built from this
+    file's own schema, as GL files may disagree.
+
+    A failed read is reported as a date error only when the date column
+    itself does not cast to timestamp[ns]; anything else names the file.
+    """
+    path, schema = relevant
+    if date_col not in schema.names:
+        raise click.ClickException(f"Cannot read {path.name}: no column '{date_col}'.")
+    date_type = schema.field(date_col).type
+    flt = (
+        (pc.field(acct_col).cast(pa.string()) == str(acct_num)) &
+        _date_filter(date_col, date_type, start, end)
+    )
+    try:
+        return pq.read_table(path, filters=flt)
+    except pa.ArrowException as exc:
+        read_exc = exc
+    try:
+        pc.cast(pq.read_table(path, columns=[date_col])[date_col], pa.timestamp("ns"))
+    except pa.ArrowInvalid as exc:
+        raise click.ClickException(
+            f"Cannot filter '{date_col}' in {path.name} – text dates must be YYYY-MM-DD ({exc})."
+        ) from exc
+    raise click.ClickException(f"Cannot read {path.name}: {read_exc}") from read_exc
 
 
 # ────────────────────────────  CLI  ──────────────────────────────────
@@ -66,7 +95,8 @@ def _find_pairs(df: pd.DataFrame, amt_col: str) -> List[Tuple[int, int]]:
 @click.argument("gl_path", type=click.Path(exists=True, path_type=Path))
 @click.option("--acct-col",  required=True, help="Column holding the account number.")
 @click.option("--acct-num",  required=True, help="Account number to deduplicate.")
-@click.option("--date-col",  required=True, help="Column with the posting date.")
+@click.option("--date-col",  required=True,
+              help="Column with the posting date (a date/timestamp, or text as YYYY-MM-DD).")
 @click.option("--start",     required=True, help="Inclusive start date  (YYYY-MM-DD).")
 @click.option("--end",       required=True, help="Inclusive end   date  (YYYY-MM-DD).")
 @click.option("--tx-col",    required=True, help="Column with the transaction identifier.")
@@ -90,58 +120,104 @@ def dedupacct_cmd(
     """
     click.echo("📂  Loading parquet files…", err=True)
 
-    start_dt = pd.to_datetime(start)
-    end_dt   = pd.to_datetime(end)
+    start_ts = pd.to_datetime(start)
+    end_ts   = pd.to_datetime(end)
 
     # 1⃣  Gather filtered rows (keep ALL original columns)
-    frames = []
-    for f in _parquet_files(gl_path):
-        df = pd.read_parquet(f)
-        mask = (
-            (df[acct_col].astype(str) == str(acct_num)) &
-            (pd.to_datetime(df[date_col]).between(start_dt, end_dt))
-        )
-        if mask.any():
-            frames.append(df.loc[mask].copy())
-
-    if not frames:
+    #     Account and date tests run inside the parquet reader, so row groups
+    #     are pruned by their statistics and only matching rows are decoded.
+    #     Files whose footer statistics rule out the account or the date
+    #     range are never opened for reading at all.  Decoding releases the
+    #     GIL, so the remaining files are read on a thread pool.
+    files = list(iter_relevant(
+        parquet_files(gl_path),
+        {acct_col: (acct_num, acct_num), date_col: (start_ts, end_ts)},
+    ))
+    read = partial(_read_account, acct_col=acct_col, acct_num=acct_num,
+                   date_col=date_col, start=start_ts, end=end_ts)
+    with ThreadPoolExecutor() as pool:
+        tables = list(pool.map(read, files))
+
+    if sum(t.num_rows for t in tables) == 0:
         click.echo("❌  No rows matched the account / date criteria.", err=True)
         raise SystemExit(1)
 
-    df_acc = pd.concat(frames, ignore_index=True)
+    # Files may store a key column differently (date32 in one, text in
+    # another; int64 account numbers next to strings); such columns cannot be
+    # concatenated, so dates are aligned on timestamp[ns] and the account and
+    # Tx-ID on string, which is what they are compared as.
+    for col, common in ((date_col, pa.timestamp("ns")),
+                        (acct_col, pa.string()), (tx_col, pa.string())):
+        if len({t.schema.field(col).type for t in tables if col in t.schema.names}) > 1:
+            tables = [
+                t.set_column(t.schema.get_field_index(col), col, pc.cast(t[col], common))
+                if col in t.schema.names else t
+                for t in tables
+            ]
+    try:
+        tbl = pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+        raise click.ClickException(f"GL files have incompatible columns: {exc}") from exc
+    del tables
 
     # 2⃣  Build Tx-level summary
-    df_acc[amount_col] = pd.to_numeric(df_acc[amount_col], errors="coerce")
-    if df_acc[amount_col].isna().any():
+    #     The float64 amounts only validate the column and weight the sums;
+    #     the column itself is written back exactly as it was loaded.
+    try:
+        amt = pc.cast(tbl[amount_col], pa.float64(), safe=True)
+    except pa.ArrowInvalid as exc:
+        if pa.types.is_integer(tbl.schema.field(amount_col).type):
+            raise click.ClickException(
+                f"Column '{amount_col}' holds integers beyond 2**53, "
+                "which cannot be summed exactly."
+            ) from exc
+        raise click.ClickException(f"Column '{amount_col}' contains non-numeric values.") from exc
+    if amt.null_count or pc.any(pc.is_nan(amt)).as_py():   # null_count is O(1)
         raise click.ClickException(f"Column '{amount_col}' contains non-numeric values.")
-
-    summary = (
-        df_acc
-        .groupby(tx_col, dropna=False, sort=False)[amount_col]
-        .sum()
-        .reset_index()
-        .rename(columns={amount_col: "_tx_sum_"})
-    )
-
-    # 3⃣  Find cancelling Tx-ID pairs
-    pairs = _find_pairs(summary, "_tx_sum_")
-    if not pairs:
+    weights = amt.to_numpy()
+    del amt
+
+    # Per-file tables were concatenated zero-copy; converting with
+    # self_destruct frees each Arrow column as soon as pandas owns a copy,
+    # so the load phase never holds both representations in full.
+    df_acc = tbl.to_pandas(split_blocks=True, self_destruct=True)
+    del tbl                                # unusable after self_destruct
+
+    # A local categorical of the Tx-IDs (df_acc itself is left untouched) gives
+    # dense integer codes, so a single bincount does the per-Tx sum without
+    # building a GroupBy object.  NaN Tx-IDs (code -1) are summed as one extra
+    # group after the categories.  Position i of `sums` is group i, so pairs
+    # index groups directly.
+    tx_cat = pd.Categorical(df_acc[tx_col])
+    codes = tx_cat.codes.astype(np.int64)
+    n_groups = len(tx_cat.categories)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, n_groups, codes)
+        n_groups += 1
+    sums = np.bincount(codes, weights=weights, minlength=n_groups)
+    del weights
+
+    # 3⃣  Find cancelling Tx-ID pairs – straight from the 1-D sums array, so
+    #     no 2-D (possibly F-ordered) block is ever traversed column-wise.
+    from ._dedup_nb import find_pairs    # lazy: loading the kernel is costly
+
+    pos_idx, neg_idx = find_pairs(sums)
+    if len(pos_idx) == 0:
         click.echo("ℹ️  No cancelling Tx-IDs found; file is unchanged.", err=True)
         cleaned = df_acc
     else:
-        txids_to_drop: Set[str] = set(
-            summary.loc[[i for pair in pairs for i in pair], tx_col].astype(str)
-        )
-        click.echo(f"🔍  Removing {len(txids_to_drop)} duplicate Tx-ID(s).", err=True)
-        cleaned = df_acc[~df_acc[tx_col].astype(str).isin(txids_to_drop)]
+        drop_group = np.zeros(n_groups, dtype=bool)
+        drop_group[pos_idx] = True
+        drop_group[neg_idx] = True
+        click.echo(f"🔍  Removing {2 * len(pos_idx)} duplicate Tx-ID(s).", err=True)
+        cleaned = df_acc[~drop_group[codes]]
 
     # 4⃣  Output
+    if out_file and out_file.suffix.lower() == ".parquet":
+        cleaned.to_parquet(out_file, index=False)
+    else:                                  # default to CSV (file or STDOUT)
+        tbl = pa.Table.from_pandas(cleaned, preserve_index=False)
+        write_csv(out_file or sys.stdout.buffer, tbl.schema, tbl.to_batches())
     if out_file:
-        if out_file.suffix.lower() == ".parquet":
-            cleaned.to_parquet(out_file, index=False)
-        else:                              # default to CSV
-            cleaned.to_csv(out_file, index=False)
         click.echo(f"✅  Wrote {len(cleaned)} rows → {out_file}", err=True)
-    else:
-        cleaned.to_csv(None, index=False)  # STDOUT
 
@@ -1,39 +1,44 @@
+import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Tuple
 
 import click
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
+from ._csv import write_csv
 
-def _find_pairs(df: pd.DataFrame, amt_col: str, show_progress: bool = False) -> List[Tuple[int, int]]:
+
+def _find_pairs(amt: np.ndarray, show_progress: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """`find_pairs` wrapped in an optional progress bar."""
+    from ._dedup_nb import find_pairs    # lazy: loading the kernel is costly
+
+    with click.progressbar(length=1, label="Finding cancelling pairs",
+                           hidden=not show_progress, file=sys.stderr) as bar:
+        pos_idx, neg_idx = find_pairs(amt)
+        bar.update(1)
+    return pos_idx, neg_idx
+
+
+def _amount_units(amounts: pa.ChunkedArray) -> np.ndarray:
     """
-    Return list of (row_index_pos, row_index_neg) that cancel each other.
-    Matching key is just abs(amount).
+    Return text *amounts* as int64 in their smallest exact unit (cents for
+    2-dp data, mills for 3-dp, …) so matching is exact.  Falls back to float64
+    when no decimal scale fits; raises ArrowInvalid on non-numeric text.
     """
-    positives: dict[float, int] = {}
-    negatives: dict[float, int] = {}
-    pairs: list[Tuple[int, int]] = []
-
-    # Prepare iterable, optionally wrapped in a progress bar
-    iterable = df[amt_col].items()
-    if show_progress:
-        iterable = click.progressbar(iterable, length=len(df), label="Finding cancelling pairs")
-
-    for idx, amount in iterable:
-        key = abs(amount)
-        if amount >= 0:
-            neg_idx = negatives.pop(key, None)
-            if neg_idx is not None:
-                pairs.append((idx, neg_idx))
-            else:
-                positives[key] = idx
-        else:
-            pos_idx = positives.pop(key, None)
-            if pos_idx is not None:
-                pairs.append((pos_idx, idx))
-            else:
-                negatives[key] = idx
-    return pairs
+    text = pc.utf8_trim_whitespace(amounts)
+    fraction = pc.replace_substring_regex(text, pattern=r"^[^.]*\.?", replacement="")
+    scale = pc.max(pc.utf8_length(fraction)).as_py() or 0
+    try:
+        exact = pc.cast(text, pa.decimal128(18, scale))
+        return pc.cast(pc.multiply(exact, 10 ** scale), pa.int64()).to_numpy()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        units = pc.cast(text, pa.float64())
+        if pc.any(pc.is_nan(units)).as_py():
+            raise pa.ArrowInvalid("NaN is not an amount")
+        return units.to_numpy()
 
 
 @click.command("dedupcsv")
@@ -56,26 +61,40 @@ def _find_pairs(df: pd.DataFrame, amt_col: str, show_progress: bool = False) ->
 )
 def dedup_cmd(csv_file: Path, amt_col: str, out_file: Path | None):
     """Remove cancelling in/out pairs from *CSV_FILE*."""
-    df = pd.read_csv(csv_file)
+    # Amounts are read as text so they can be parsed exactly (see _amount_units)
+    try:
+        table = pacsv.read_csv(
+            csv_file,
+            convert_options=pacsv.ConvertOptions(column_types={amt_col: pa.string()}),
+        )
+    except pa.ArrowInvalid as exc:
+        raise click.ClickException(f"Cannot read {csv_file.name}: {exc}") from exc
+
+    if amt_col not in table.column_names:
+        raise click.BadParameter(f"'{amt_col}' not in columns: {', '.join(table.column_names)}")
 
-    if amt_col not in df.columns:
-        raise click.BadParameter(f"'{amt_col}' not in columns: {', '.join(df.columns)}")
+    try:
+        if table[amt_col].null_count:
+            raise pa.ArrowInvalid("null amount")
+        units = _amount_units(table[amt_col])
+        numeric = pc.cast(pc.utf8_trim_whitespace(table[amt_col]), pa.float64())
+    except pa.ArrowInvalid as exc:
+        raise click.ClickException(f"Column '{amt_col}' contains non-numeric values.") from exc
 
-    df[amt_col] = pd.to_numeric(df[amt_col], errors="coerce")
-    if df[amt_col].isna().any():
-        raise click.ClickException(f"Column '{amt_col}' contains non-numeric values.")
+    table = table.set_column(table.schema.get_field_index(amt_col), amt_col, numeric)
 
     # Find cancelling pairs with a progress bar
-    pairs = _find_pairs(df, amt_col, show_progress=True)
+    pos_idx, neg_idx = _find_pairs(units, show_progress=True)
 
-    # Drop matched rows
-    cleaned = df.drop(index=[i for p in pairs for i in p]) if pairs else df
+    # Drop matched rows with a positional mask (no label lookups)
+    keep = np.ones(table.num_rows, dtype=bool)
+    keep[pos_idx] = False
+    keep[neg_idx] = False
+    cleaned = table.filter(keep)
 
+    write_csv(out_file or sys.stdout.buffer, cleaned.schema, cleaned.to_batches())
     if out_file:
-        cleaned.to_csv(out_file, index=False)
         click.echo(f"✅  Wrote cleaned file to {out_file}")
-    else:
-        cleaned.to_csv(None, index=False)
 
 
 if __name__ == "__main__":
@@ -11,21 +11,38 @@ toolbox txlookup ./gl_export      \
         --out matches.csv
 """
 
+import sys
 from pathlib import Path
-from typing import Iterable, Set
 
 import click
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
+from ._csv import write_csv
+from ._parquet import parquet_files
 
-def _parquet_files(gl_path: Path) -> Iterable[Path]:
-    """Yield every *.parquet file under *gl_path* (non-recursively)."""
-    if gl_path.is_file() and gl_path.suffix == ".parquet":
-        yield gl_path
-    elif gl_path.is_dir():
-        yield from sorted(gl_path.glob("*.parquet"))
-    else:
-        raise click.BadParameter(f"{gl_path} is neither a directory nor a parquet file.")
+
+def _type_kind(typ: pa.DataType) -> str:
+    """Collapse Arrow types that compare against each other (int32/int64, …)."""
+    if pa.types.is_integer(typ):
+        return "integer"
+    if pa.types.is_string(typ) or pa.types.is_large_string(typ):
+        return "string"
+    return str(typ)
+
+
+def _equals(column: str, typ: pa.DataType, value: float) -> pc.Expression:
+    """
+    Return `column == value`, with *value* cast to the column's own type so
+    the reader can still prune on statistics.  Values that do not convert
+    exactly (7.5 on an int column) fall back to a float64 comparison.
+    """
+    try:
+        return pc.field(column) == pa.scalar(value).cast(typ)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+        return pc.field(column).cast(pa.float64()) == value
 
 
 @click.command("txlookup")
@@ -68,35 +85,66 @@ def txlookup_cmd(
     """
     click.echo("🔍  Scanning GL files…", err=True)
 
-    # Pass 1 – discover the set of Tx-IDs that contain the lookup amount
-    target_txids: Set[str] = set()
-    for f in _parquet_files(gl_path):
-        df = pd.read_parquet(f, columns=[amount_col, tx_col])
-        hits = df.loc[df[amount_col] == lookup, tx_col].dropna().unique()
-        target_txids.update(map(str, hits))
-
-    if not target_txids:
+    # One dataset serves both passes, so file discovery and schema
+    # inspection happen only once.  Its schema is unified over every file's
+    # footer rather than taken from the first file.  An amount column stored
+    # with different types across files (int64 / float64 / decimal) is read
+    # as float64, like the per-file pandas reads used to compare it.
+    files = list(parquet_files(gl_path))
+    if not files:
+        raise click.BadParameter(f"{gl_path} contains no parquet files.")
+    schemas = [pq.read_schema(f) for f in files]
+    tx_kinds = {f.name: _type_kind(sch.field(tx_col).type)
+                for f, sch in zip(files, schemas) if tx_col in sch.names}
+    if len(set(tx_kinds.values())) > 1:
+        listing = ", ".join(f"{name}: {kind}" for name, kind in tx_kinds.items())
+        raise click.ClickException(
+            f"Column '{tx_col}' has a different type across files ({listing})."
+        )
+    try:
+        schema = pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as exc:
+        raise click.ClickException(f"GL files have incompatible columns: {exc}") from exc
+    if len({sch.field(amount_col).type for sch in schemas if amount_col in sch.names}) > 1:
+        schema = schema.set(schema.get_field_index(amount_col), pa.field(amount_col, pa.float64()))
+    dataset = ds.dataset(files, schema=schema, format="parquet")
+
+    # Pass 1 – discover the set of Tx-IDs that contain the lookup amount.
+    # The filter is pushed into the parquet reader, so row groups whose
+    # min/max statistics exclude LOOKUP are never decoded.
+    try:
+        hits = dataset.to_table(
+            columns=[tx_col], filter=_equals(amount_col, schema.field(amount_col).type, lookup)
+        )
+    except (KeyError, pa.ArrowException) as exc:
+        raise click.ClickException(f"Cannot scan GL files: {exc}") from exc
+    target_txids = pc.unique(hits[tx_col]).drop_null()   # native Tx-ID dtype
+
+    if len(target_txids) == 0:
         click.echo("❌  No matching amount found in any file.", err=True)
         raise SystemExit(1)
 
     click.echo(f"✅  Found {len(target_txids)} Tx-ID(s) with amount {lookup}", err=True)
 
-    # Pass 2 – pull every row whose Tx-ID is in the discovered set
-    frames = []
-    for f in _parquet_files(gl_path):
-        df = pd.read_parquet(f)
-        frames.append(df[df[tx_col].astype(str).isin(target_txids)])
-
-    result = pd.concat(frames, ignore_index=True)
-
-    # Output
+    # Pass 2 – stream every row whose Tx-ID is in the discovered set, one
+    # record batch at a time, straight to the output.
+    scanner = dataset.scanner(filter=pc.field(tx_col).isin(target_txids))
+
+    # Output – the shared CSV writer for both the file and STDOUT.  A file is
+    # written next to OUT first and only renamed once every batch succeeded,
+    # so a failing scan never leaves a truncated OUT behind.
+    part = out_file.with_name(f".{out_file.name}.part") if out_file else None
+    try:
+        n_rows = write_csv(part or sys.stdout.buffer, scanner.projected_schema,
+                           scanner.to_batches())
+    except pa.ArrowException as exc:
+        if part:
+            part.unlink(missing_ok=True)
+        raise click.ClickException(f"Cannot scan GL files: {exc}") from exc
     if out_file:
-        result.to_csv(out_file, index=False)
-        click.echo(f"📄  Wrote {len(result)} rows → {out_file}", err=True)
-    else:
-        result.to_csv(None, index=False)  # STDOUT
+        part.replace(out_file)
+        click.echo(f"📄  Wrote {n_rows} rows → {out_file}", err=True)
 
 
 if __name__ == "__main__":
     txlookup_cmd()
-